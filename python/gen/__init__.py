@@ -15,14 +15,18 @@ try:
     __all__ = ["Repository", "get_gen_dir", "PyBlockGroup", "PyBaseLayout", "PyScaledLayout"]
     
 except ImportError as e:
-    import sys
     import warnings
     import os
     
-    warnings.warn(f"Failed to import Gen modules: {e}")
-    
-    # Try to print diagnostic information to help with troubleshooting
-    package_dir = os.path.dirname(__file__)
-    warnings.warn(f"Package directory contents: {os.listdir(package_dir)}")
+    # Only report once, even across importlib.reload (which keeps module globals), and
+    # stay silent entirely when GEN_QUIET is set
+    if not globals().get("_import_error_reported") and not os.environ.get("GEN_QUIET"):
+        warnings.warn(f"Failed to import Gen modules: {e}")
+
+        # Try to print diagnostic information to help with troubleshooting
+        with os.scandir(os.path.dirname(__file__)) as entries:
+            package_contents = [entry.name for entry in entries]
+        warnings.warn(f"Package directory contents: {package_contents}")
+    _import_error_reported = True
     
     __all__ = []